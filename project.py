@@ -1,95 +1,201 @@
-from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN
+from decimal import Context, Decimal, ROUND_HALF_EVEN, ROUND_HALF_UP
+from functools import lru_cache
 import operator
 
+# Fixed context for memoized factors, so a cached result never depends on the caller's context
+_FACTOR_CONTEXT = Context(prec=28, rounding=ROUND_HALF_EVEN)
+
+@lru_cache(maxsize=1024)
+def _compound_factor(rate: Decimal, periods: int) -> Decimal:
+    """Growth factor (1 + rate) ** periods, memoized for repeated schedule calculations"""
+    return _FACTOR_CONTEXT.power(_FACTOR_CONTEXT.add(1, rate), periods)
+
+def _allocate_units(amount: int, ratios, total_ratio):
+    """Share out amount minor units by ratios, truncating each share; the last takes the remainder"""
+    shares = []
+    remaining = amount
+    for ratio in ratios[:-1]:
+        weighted = amount * ratio
+        # Truncate towards zero (ROUND_DOWN) rather than floor
+        units = int(abs(weighted) // abs(total_ratio))
+        if (weighted < 0) != (total_ratio < 0):
+            units = -units
+        shares.append(units)
+        remaining -= units
+    shares.append(remaining)
+    return shares
+
 class AdvancedMoney(Money):
     """Money class with advanced financial operations"""
 
+    __slots__ = ()
+
     def split(self, ways: int, rounding=ROUND_HALF_UP):
         """Split money amount into equal parts"""
         if ways <= 0:
             raise ValueError("Cannot split into zero or negative parts")
 
         quotient, remainder = divmod(self._amount, ways)
-        amounts = [Money(quotient, self._currency) for _ in range(ways)]
-
-        remainder_cents = int(remainder * (10 ** self._currency_info['decimals']))
-        for i in range(remainder_cents):
-            amounts[i] += Money(Decimal('0.01'), self._currency)
-
-        return amounts
+        return ([self._from_int(quotient + 1, self._currency) for _ in range(remainder)] +
+                [self._from_int(quotient, self._currency) for _ in range(ways - remainder)])
 
     def allocate(self, ratios):
         """Allocate money according to given ratios"""
-        if not ratios or all(r <= 0 for r in ratios):
+        # Validate, normalize and total the ratios in a single pass;
+        # integer ratios stay ints so the common case never touches Decimal
+        normalized = []
+        total_ratio = 0
+        any_positive = False
+        for ratio in ratios:
+            if type(ratio) is not int:
+                ratio = _to_decimal(ratio)
+            if ratio > 0:
+                any_positive = True
+            total_ratio += ratio
+            normalized.append(ratio)
+        if not any_positive:
             raise ValueError("All ratios must be positive")
 
-        total_ratio = sum(ratios)
-        allocated = []
-        remaining = self._amount
-
-        for i, ratio in enumerate(ratios):
-            if i == len(ratios) - 1:
-                allocated.append(Money(remaining, self._currency))
-            else:
-                amount = (self._amount * Decimal(str(ratio)) / Decimal(str(total_ratio))).quantize(
-                    Decimal('0.01'), rounding=ROUND_DOWN)
-                allocated.append(Money(amount, self._currency))
-                remaining -= amount
-
-        return allocated
+        shares = _allocate_units(self._amount, normalized, total_ratio)
+        return [self._from_int(units, self._currency) for units in shares]
 
     def compound_interest(self, rate: Decimal, periods: int):
         """Calculate compound interest"""
         if periods <= 0:
-            return Money('0', self._currency)
+            return self._from_int(0, self._currency)
 
-        rate_decimal = Decimal(str(rate))
-        final_amount = self._amount * ((1 + rate_decimal) ** periods)
-        return Money(final_amount - self._amount, self._currency)
+        rate_decimal = _to_decimal(rate)
+        interest_units = _round_units(self._amount * (_compound_factor(rate_decimal, periods) - 1))
+        return self._from_int(interest_units, self._currency)
 
     def present_value(self, rate: Decimal, periods: int):
         """Calculate present value"""
         if periods <= 0:
-            return Money(self._amount, self._currency)
+            return self._from_int(self._amount, self._currency)
 
-        rate_decimal = Decimal(str(rate))
-        pv_amount = self._amount / ((1 + rate_decimal) ** periods)
-        return Money(pv_amount, self._currency)
+        rate_decimal = _to_decimal(rate)
+        pv_units = _round_units(self._amount / _compound_factor(rate_decimal, periods))
+        return self._from_int(pv_units, self._currency)
 
     def percentage_of(self, total):
         """Calculate what percentage this amount is of a total"""
-        if not isinstance(total, Money) or total.currency != self._currency:
+        if not isinstance(total, Money) or total._currency != self._currency:
             raise IncompatibleCurrencyError("Total must be same currency")
-        if total.amount == 0:
+        if total._amount == 0:
             return Decimal('0')
 
-        return (self._amount / total._amount * 100).quantize(Decimal('0.01'))
+        return (Decimal(self._amount) / total._amount * 100).quantize(Decimal('0.01'))
 
     @classmethod
     def sum(cls, money_list):
         """Sum a list of Money objects"""
+        if isinstance(money_list, MoneyArray):
+            return money_list.sum()
         if not money_list:
             return None
 
-        result = money_list[0]
-        for money in money_list[1:]:
-            result += money
-        return result
+        try:
+            currency = money_list[0]._currency
+            total = money_list[0]._amount
+            for money in money_list[1:]:
+                if money._currency != currency:
+                    raise IncompatibleCurrencyError(f"Cannot add {currency} and {money._currency}")
+                total += money._amount
+        except AttributeError:
+            # Plain numbers mixed into the list fall back to Money arithmetic
+            result = money_list[0]
+            for money in money_list[1:]:
+                result += money
+            if isinstance(result, Money):
+                result = cls._from_int(result._amount, result._currency)
+            return result
+        return cls._from_int(total, currency)
 
     @classmethod
     def max(cls, money_list):
         """Find maximum Money object in list"""
+        if isinstance(money_list, MoneyArray):
+            return money_list.max()
         return max(money_list) if money_list else None
 
     @classmethod
     def min(cls, money_list):
         """Find minimum Money object in list"""
+        if isinstance(money_list, MoneyArray):
+            return money_list.min()
         return min(money_list) if money_list else None
 
     def apply_discount(self, discount_rate: Decimal):
         """Apply a percentage discount"""
-        discount_amount = self * discount_rate
-        return self - discount_amount, discount_amount
+        discount_units = _round_units(self._amount * _to_decimal(discount_rate))
+        return (self._from_int(self._amount - discount_units, self._currency),
+                self._from_int(discount_units, self._currency))
+
+
+class MoneyArray:
+    """Batch of same-currency amounts held as a tuple of int minor units
+
+    sum, max and min run the builtins directly over plain ints instead of
+    going through Money comparisons and arithmetic one object at a time.
+    Like AdvancedMoney.sum/max/min, they return None for an empty batch.
+    """
+
+    __slots__ = ('_cents', '_currency')
+
+    def __init__(self, money_list, currency: str = None):
+        """Pack Money objects of one currency into a MoneyArray
+
+        The currency defaults to that of the first Money, or USD for an empty list.
+        """
+        if currency is None:
+            currency = money_list[0]._currency if money_list else 'USD'
+        if currency not in VALID_CURRENCIES:
+            raise InvalidCurrencyError(f"Invalid currency: {currency}")
+        for money in money_list:
+            if money._currency != currency:
+                raise IncompatibleCurrencyError(f"Cannot pack {money._currency} with {currency}")
+        self._currency = currency
+        self._cents = tuple(money._amount for money in money_list)
+
+    @classmethod
+    def from_cents_array(cls, cents, currency: str = 'USD'):
+        """Build a MoneyArray directly from an iterable of int minor units (cents)"""
+        money_array = cls([], currency)
+        money_array._cents = tuple(cents)
+        return money_array
+
+    def __len__(self):
+        return len(self._cents)
+
+    def __iter__(self):
+        return (AdvancedMoney._from_int(cents, self._currency) for cents in self._cents)
+
+    @property
+    def currency(self):
+        """Get the currency code"""
+        return self._currency
+
+    def sum(self):
+        """Sum all amounts"""
+        return AdvancedMoney._from_int(sum(self._cents), self._currency) if self._cents else None
+
+    def max(self):
+        """Find the largest amount"""
+        return AdvancedMoney._from_int(max(self._cents), self._currency) if self._cents else None
+
+    def min(self):
+        """Find the smallest amount"""
+        return AdvancedMoney._from_int(min(self._cents), self._currency) if self._cents else None
+
+    def percentage_of(self, total):
+        """Calculate what percentage each amount is of a total"""
+        if not isinstance(total, Money) or total._currency != self._currency:
+            raise IncompatibleCurrencyError("Total must be same currency")
+        if total._amount == 0:
+            return [Decimal('0')] * len(self._cents)
+
+        quantizer = Decimal('0.01')
+        return [(Decimal(cents) / total._amount * 100).quantize(quantizer) for cents in self._cents]
 
 
 # === Demonstration of Advanced Money Operations ===
@@ -155,6 +261,11 @@ print(f"Total expenses: {AdvancedMoney.sum(expenses)}")
 print(f"Highest expense: {AdvancedMoney.max(expenses)}")
 print(f"Lowest expense: {AdvancedMoney.min(expenses)}")
 
+# Batch operations over packed amounts
+expense_array = MoneyArray(expenses)
+print(f"Batch total/highest/lowest: {AdvancedMoney.sum(expense_array)} / "
+      f"{AdvancedMoney.max(expense_array)} / {AdvancedMoney.min(expense_array)}")
+
 # Percentage breakdown
 total_expenses = AdvancedMoney.sum(expenses)
 print("\nExpense breakdown:")
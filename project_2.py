@@ -1,5 +1,6 @@
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Context, Decimal, MAX_PREC, ROUND_HALF_UP
 from typing import Union
+import warnings
 
 # Currency definitions
 VALID_CURRENCIES = {
@@ -7,6 +8,26 @@ VALID_CURRENCIES = {
     'EUR': {'symbol': '€', 'decimals': 2}
 }
 
+# Quantizer per currency, e.g. Decimal('0.01') for 2 decimal places
+_QUANTIZER = {code: Decimal(1).scaleb(-info['decimals']) for code, info in VALID_CURRENCIES.items()}
+
+# Unbounded precision so converting minor units back to major units never rounds
+_EXACT_CONTEXT = Context(prec=MAX_PREC)
+
+def _to_decimal(value, _Decimal=Decimal):
+    """Convert a numeric value to Decimal, only round-tripping through str for floats"""
+    value_type = type(value)
+    if value_type is _Decimal:
+        return value
+    if value_type is int:
+        return _Decimal(value)
+    return _Decimal(str(value))
+
+def _round_units(value: Decimal, _one=Decimal(1), _rounding=ROUND_HALF_UP) -> int:
+    """Round a Decimal count of minor units half-up to a whole int"""
+    # quantize raises InvalidOperation rather than silently dropping digits beyond the context precision
+    return int(value.quantize(_one, rounding=_rounding))
+
 # Custom exceptions
 class InvalidCurrencyError(Exception):
     pass
@@ -17,28 +38,62 @@ class IncompatibleCurrencyError(Exception):
 class Money:
     """Complete Money class with arithmetic operations using containment"""
 
+    __slots__ = ('_amount', '_currency', '_currency_info', '_str')
+
     def __init__(self, amount: Union[str, int, float, Decimal], currency: str = 'USD'):
-        """Initialize Money object with amount and currency"""
+        """Initialize Money object with amount and currency
+
+        Float amounts are deprecated: most cent values have no exact binary float.
+        Pass a str or Decimal, or an int count of minor units via Money.from_cents.
+        """
         if currency not in VALID_CURRENCIES:
             raise InvalidCurrencyError(f"Invalid currency: {currency}")
+        if type(amount) is float:
+            warnings.warn("Money from float is deprecated; pass a str, Decimal or use Money.from_cents",
+                          DeprecationWarning, stacklevel=2)
         self._currency = currency
-        self._amount = Decimal(str(amount))
         self._currency_info = VALID_CURRENCIES[currency]
 
-        # Round to currency precision
-        decimal_places = self._currency_info['decimals']
-        if decimal_places > 0:
-            quantizer = Decimal('0.' + '0' * (decimal_places - 1) + '1')
-            self._amount = self._amount.quantize(quantizer, rounding=ROUND_HALF_UP)
+        # Round to currency precision and store as an int count of minor units (e.g. cents)
+        rounded = _to_decimal(amount).quantize(_QUANTIZER[currency], rounding=ROUND_HALF_UP)
+        self._amount = int(rounded.scaleb(self._currency_info['decimals']))
+        self._str = None
+
+    @classmethod
+    def from_cents(cls, cents: int, currency: str = 'USD'):
+        """Create Money from an int count of minor units, e.g. Money.from_cents(1995) is $19.95"""
+        if currency not in VALID_CURRENCIES:
+            raise InvalidCurrencyError(f"Invalid currency: {currency}")
+        if not isinstance(cents, int):
+            raise TypeError("Cents must be an int count of minor units")
+        return cls._from_int(cents, currency)
+
+    @classmethod
+    def _from_int(cls, units: int, currency: str, _currencies=VALID_CURRENCIES):
+        """Build Money from an int count of minor units of a known-valid currency"""
+        # Module globals are bound as defaults so hot-path lookups are locals
+        money = cls.__new__(cls)
+        money._currency = currency
+        money._currency_info = _currencies[currency]
+        money._amount = units
+        money._str = None
+        return money
+
+    @classmethod
+    def _from_decimal(cls, amount: Decimal, currency: str,
+                      _quantizer=_QUANTIZER, _rounding=ROUND_HALF_UP, _currencies=VALID_CURRENCIES):
+        """Build Money from a Decimal amount in major units of a known-valid currency"""
+        rounded = amount.quantize(_quantizer[currency], rounding=_rounding)
+        return cls._from_int(int(rounded.scaleb(_currencies[currency]['decimals'])), currency)
 
     def __add__(self, other):
         """Add two Money objects or Money and numeric value"""
         if isinstance(other, Money):
             if self._currency != other._currency:
                 raise IncompatibleCurrencyError(f"Cannot add {self._currency} and {other._currency}")
-            return Money(self._amount + other._amount, self._currency)
+            return Money._from_int(self._amount + other._amount, self._currency)
         else:
-            return Money(self._amount + Decimal(str(other)), self._currency)
+            return Money._from_decimal(self.amount + _to_decimal(other), self._currency)
 
     def __radd__(self, other):
         """Right addition for numeric + Money"""
@@ -49,19 +104,19 @@ class Money:
         if isinstance(other, Money):
             if self._currency != other._currency:
                 raise IncompatibleCurrencyError(f"Cannot subtract {other._currency} from {self._currency}")
-            return Money(self._amount - other._amount, self._currency)
+            return Money._from_int(self._amount - other._amount, self._currency)
         else:
-            return Money(self._amount - Decimal(str(other)), self._currency)
+            return Money._from_decimal(self.amount - _to_decimal(other), self._currency)
 
     def __rsub__(self, other):
         """Right subtraction for numeric - Money"""
-        return Money(Decimal(str(other)) - self._amount, self._currency)
+        return Money._from_decimal(_to_decimal(other) - self.amount, self._currency)
 
     def __mul__(self, other):
         """Multiply Money by a numeric value"""
         if isinstance(other, Money):
             raise TypeError("Cannot multiply Money by Money")
-        return Money(self._amount * Decimal(str(other)), self._currency)
+        return Money._from_int(_round_units(Decimal(self._amount) * _to_decimal(other)), self._currency)
 
     def __rmul__(self, other):
         """Right multiplication for numeric * Money"""
@@ -72,35 +127,36 @@ class Money:
         if isinstance(other, Money):
             if self._currency != other._currency:
                 raise IncompatibleCurrencyError(f"Cannot divide {self._currency} by {other._currency}")
-            return self._amount / other._amount
+            return Decimal(self._amount) / Decimal(other._amount)
         else:
-            return Money(self._amount / Decimal(str(other)), self._currency)
+            return Money._from_int(_round_units(Decimal(self._amount) / _to_decimal(other)), self._currency)
 
     def __floordiv__(self, other):
         """Floor division"""
         if isinstance(other, Money):
             if self._currency != other._currency:
                 raise IncompatibleCurrencyError(f"Cannot divide {self._currency} by {other._currency}")
-            return self._amount // other._amount
+            return Decimal(self._amount) // Decimal(other._amount)
         else:
-            return Money(self._amount // Decimal(str(other)), self._currency)
+            return Money._from_decimal(self.amount // _to_decimal(other), self._currency)
 
     def __mod__(self, other):
         """Modulo operation"""
         if isinstance(other, Money):
             if self._currency != other._currency:
                 raise IncompatibleCurrencyError(f"Cannot mod {self._currency} by {other._currency}")
-            return Money(self._amount % other._amount, self._currency)
+            # Decimal remainder keeps the sign of the dividend, unlike int %
+            return Money._from_int(int(Decimal(self._amount) % Decimal(other._amount)), self._currency)
         else:
-            return Money(self._amount % Decimal(str(other)), self._currency)
+            return Money._from_decimal(self.amount % _to_decimal(other), self._currency)
 
     def __neg__(self):
         """Unary minus"""
-        return Money(-self._amount, self._currency)
+        return Money._from_int(-self._amount, self._currency)
 
     def __abs__(self):
         """Absolute value"""
-        return Money(abs(self._amount), self._currency)
+        return Money._from_int(abs(self._amount), self._currency)
 
     def __lt__(self, other):
         """Less than comparison"""
@@ -112,7 +168,11 @@ class Money:
 
     def __le__(self, other):
         """Less than or equal comparison"""
-        return self < other or self == other
+        if not isinstance(other, Money):
+            raise TypeError("Cannot compare Money with non-Money")
+        if self._currency != other._currency:
+            raise IncompatibleCurrencyError(f"Cannot compare {self._currency} with {other._currency}")
+        return self._amount <= other._amount
 
     def __gt__(self, other):
         """Greater than comparison"""
@@ -124,12 +184,16 @@ class Money:
 
     def __ge__(self, other):
         """Greater than or equal comparison"""
-        return self > other or self == other
+        if not isinstance(other, Money):
+            raise TypeError("Cannot compare Money with non-Money")
+        if self._currency != other._currency:
+            raise IncompatibleCurrencyError(f"Cannot compare {self._currency} with {other._currency}")
+        return self._amount >= other._amount
 
     @property
     def amount(self):
-        """Get the contained Decimal amount"""
-        return self._amount
+        """Get the amount as a Decimal in major units"""
+        return Decimal(self._amount).scaleb(-self._currency_info['decimals'], _EXACT_CONTEXT)
 
     @property
     def currency(self):
@@ -137,16 +201,18 @@ class Money:
         return self._currency
 
     def __str__(self):
-        """String representation"""
-        symbol = self._currency_info['symbol']
-        if self._currency_info['decimals'] > 0:
-            return f"{symbol}{self._amount}"
-        else:
-            return f"{symbol}{int(self._amount)}"
+        """String representation, cached since Money is immutable"""
+        if self._str is None:
+            symbol = self._currency_info['symbol']
+            if self._currency_info['decimals'] > 0:
+                self._str = f"{symbol}{self.amount}"
+            else:
+                self._str = f"{symbol}{self._amount}"
+        return self._str
 
     def __repr__(self):
         """Debug representation"""
-        return f"Money({self._amount}, '{self._currency}')"
+        return f"Money({self.amount}, '{self._currency}')"
 
 
 # === Demonstrate arithmetic operations ===